@@ -49,14 +49,17 @@ Example usage:
 import asyncio
 import logging
 import os
+import re
+import time
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import feedparser  # type: ignore
 import httpx
+import orjson
 from aiogram import Bot, Dispatcher, types
-from aiogram.contrib.middlewares.logging import LoggingMiddleware
 from aiogram.utils import executor
+from aiolimiter import AsyncLimiter
 
 
 # -----------------------------------------------------------------------------
@@ -98,15 +101,25 @@ KEYWORD_TRIGGER_LIST: List[str] = [
     "قیمت",
 ]
 
+# Precompiled patterns so keyword_handler does a single C-level scan per
+# message instead of one Python substring search per keyword.
+_KEYWORD_RE = re.compile("|".join(re.escape(k) for k in KEYWORD_TRIGGER_LIST))
+_NEWS_RE = re.compile("اخبار")
+
 # Keys in the tgju JSON object corresponding to the values we want to display.
-# The mapping is from a human‐readable label (used in the output) to the JSON
-# key returned by tgju.  The labels are intentionally kept short and
-# descriptive.  The JSON keys and meaning were verified by inspecting the
-# endpoint【769651394788223†L43-L53】【769651394788223†L418-L421】.
-PRICE_KEYS: Dict[str, str] = {
-    "قیمت لحظه‌ای دلار": "price_dollar_rl",  # Free market USD/IRR price
-    "سکه امامی": "sekee_real",               # Imam gold coin price
-    "انس طلا جهانی": "ons",                  # Gold ounce in USD
+# The mapping is from a human‐readable label (used in the output) to a tuple
+# ``(json_key, to_toman, fmt)``: the key returned by tgju, whether the rial
+# value must be divided by 10 to get tomans, and the display formatter.
+# Resolving the per-instrument branching here at import time keeps the fetch
+# loop free of ``if key == "ons"`` checks.  The JSON keys and meaning were
+# verified by inspecting the endpoint【769651394788223†L43-L53】【769651394788223†L418-L421】.
+PRICE_KEYS: Dict[str, Tuple[str, bool, Callable[[float], str]]] = {
+    # Free market USD/IRR price
+    "قیمت لحظه‌ای دلار": ("price_dollar_rl", True, lambda v: f"{int(v):,}"),
+    # Imam gold coin price
+    "سکه امامی": ("sekee_real", True, lambda v: f"{int(v):,}"),
+    # Gold ounce in USD
+    "انس طلا جهانی": ("ons", False, lambda v: f"{v:,.2f}"),
 }
 
 # -----------------------------------------------------------------------------
@@ -114,15 +127,94 @@ PRICE_KEYS: Dict[str, str] = {
 #
 CHANNEL_ID = "@sarasoo"
 
+# Telegram enforces a bot-wide limit of ~30 outbound messages per second;
+# exceeding it earns 429s and retries.  All outbound API calls go through
+# this limiter so bursts are queued and smoothed instead of being lost to
+# flood errors.
+_TG_LIMITER = AsyncLimiter(30, 1)
+
+
+async def _answer(message: types.Message, text: str, **kwargs) -> types.Message:
+    """Send a reply through the global outbound rate limiter."""
+
+    async with _TG_LIMITER:
+        return await message.answer(text, **kwargs)
+
+
+async def _delete(message: types.Message) -> None:
+    """Delete a message through the global outbound rate limiter."""
+
+    async with _TG_LIMITER:
+        await message.delete()
+
+# Shared HTTP client reused for every outbound request.  Creating one client
+# per call forces a fresh TCP + TLS handshake against tgju.org and the news
+# feeds on every command; a single pooled client keeps connections alive so
+# repeat requests skip the handshake entirely.  It is created in
+# ``on_startup`` (so it binds to the bot's event loop) and closed in
+# ``on_shutdown``.
+HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it lazily if needed."""
+
+    global HTTP_CLIENT
+    if HTTP_CLIENT is None:
+        HTTP_CLIENT = httpx.AsyncClient(
+            timeout=10.0,
+            headers={"User-Agent": "Mozilla/5.0"},
+            # tgju and the news CDNs sit behind nginx-class servers whose
+            # server-side keep-alive is typically 75s; httpx's 5s default
+            # would drop the socket between sparse /price requests, so we
+            # stretch the expiry to match and keep reusing the connection
+            # across minutes of idle time.
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=75.0,
+            ),
+        )
+    return HTTP_CLIENT
+
+
+# Channel-membership cache: get_chat_member is a full round trip to Telegram
+# and fires for every /start, /price and /news.  Membership changes rarely,
+# so each user's result is remembered for a few minutes and repeat commands
+# skip the API call entirely.
+MEMBER_CACHE_TTL = 300.0  # seconds
+_MEMBER_CACHE: Dict[int, Tuple[float, bool]] = {}
+
+# Users known to be channel members right now, maintained from Telegram's
+# chat_member update events (see channel_member_updated below).  Lookups
+# against this set need no network and no TTL: Telegram tells us when
+# someone joins or leaves.  The TTL cache above remains as a fallback for
+# users we have not seen an event for since startup.
+_KNOWN_MEMBERS: set = set()
+
+_MEMBER_STATUSES = ("member", "creator", "administrator")
+
 
 async def is_user_member(user_id: int, bot: Bot, channel_username: str) -> bool:
+    if user_id in _KNOWN_MEMBERS:
+        return True
+
+    ts, cached = _MEMBER_CACHE.get(user_id, (0.0, False))
+    if time.monotonic() - ts < MEMBER_CACHE_TTL:
+        return cached
+
     try:
         member = await bot.get_chat_member(channel_username, user_id)
-        return member.status in ["member", "creator", "administrator"]
+        result = member.status in _MEMBER_STATUSES
     except Exception as e:
         logging.error(f"Error checking membership: {e}")
         return False
 
+    if result:
+        _KNOWN_MEMBERS.add(user_id)
+    _MEMBER_CACHE[user_id] = (time.monotonic(), result)
+    return result
+
 
 
 
@@ -139,105 +231,275 @@ async def fetch_json(url: str) -> Dict:
         httpx.HTTPError: If the request fails.
         ValueError: If the response body is not valid JSON.
     """
-    async with httpx.AsyncClient(
-            timeout=10.0,
-            headers={"User-Agent": "Mozilla/5.0"}
-    ) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        return response.json()
+    response = await _get_http_client().get(url)
+    response.raise_for_status()
+    # orjson parses the multi-hundred-entry tgju payload in native code,
+    # several times faster than the stdlib json used by response.json()
+    return orjson.loads(response.content)
+
+
+# In-process TTL caches.  Prices move roughly once a minute and the RSS
+# feeds refresh on the order of minutes, so bursts of users can share one
+# upstream fetch instead of each hammering tgju and the news feeds.
+# Entries are kept past their fresh TTL (up to the stale TTL) so that a
+# transient upstream failure can be answered with the last good payload
+# instead of an error message.
+PRICE_CACHE_TTL = 30.0  # seconds
+NEWS_CACHE_TTL = 120.0  # seconds
+STALE_CACHE_TTL = 600.0  # how long stale data may be served after a failure
+
+# Persian marker appended to responses served from a stale cache entry.
+STALE_NOTICE = "(آخرین داده‌ی در دسترس)"
+
+# Cache entries are (fetched_at, stale_until, value) tuples.
+_PRICE_CACHE: Optional[Tuple[float, float, Tuple[str, Dict[str, Tuple[str, datetime]]]]] = None
+_NEWS_CACHE: Optional[Tuple[float, float, List[Tuple[str, str]]]] = None
+
+def price_cache_is_warm() -> bool:
+    """Return True if the price cache can answer without an upstream fetch."""
+
+    return bool(_PRICE_CACHE) and time.monotonic() - _PRICE_CACHE[0] < PRICE_CACHE_TTL
+
+
+def news_cache_is_warm() -> bool:
+    """Return True if the news cache can answer without an upstream fetch."""
+
+    return bool(_NEWS_CACHE) and time.monotonic() - _NEWS_CACHE[0] < NEWS_CACHE_TTL
+
+
+# Single-flight guard: when many users press /price in the same second the
+# cache is cold for all of them, and without this every one of them would
+# launch its own tgju request.  The first caller creates the future and does
+# the real fetch; everyone else just awaits its result.
+_PRICE_INFLIGHT: Optional[asyncio.Future] = None
+
+
+# Translation table that strips thousands separators without the extra
+# string allocation of str.replace.
+_NOCOMMA = str.maketrans("", "", ",")
+
+
+def _parse_tgju_ts(ts_str: str) -> datetime:
+    """Parse tgju's fixed ``YYYY-MM-DD HH:MM:SS`` timestamp by slicing.
+
+    tgju always returns this exact 19-character shape, so direct slicing
+    beats the general-purpose ``datetime.fromisoformat`` parser and a cheap
+    length check replaces the exception path for malformed input.  Falls
+    back to the current time, matching the previous behaviour.
+    """
+
+    if ts_str and len(ts_str) == 19:
+        try:
+            return datetime(
+                int(ts_str[0:4]),
+                int(ts_str[5:7]),
+                int(ts_str[8:10]),
+                int(ts_str[11:13]),
+                int(ts_str[14:16]),
+                int(ts_str[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+    return datetime.now(timezone.utc)
+
+
+async def fetch_prices() -> Tuple[str, Dict[str, Tuple[str, datetime]], bool]:
+    """Fetch and parse the latest market prices from tgju.org.
+
+    Results are cached for ``PRICE_CACHE_TTL`` seconds so concurrent users
+    share a single upstream request.  If the upstream fetch fails while a
+    stale entry is still within ``STALE_CACHE_TTL``, that entry is served
+    instead and the third element of the returned tuple is ``True``.
+    Concurrent cache misses are coalesced so at most one tgju request is in
+    flight at any time.
+    """
+
+    global _PRICE_INFLIGHT
+    if price_cache_is_warm():
+        server_time, result = _PRICE_CACHE[2]
+        return server_time, result, False
+
+    if _PRICE_INFLIGHT is not None:
+        return await _PRICE_INFLIGHT
+
+    _PRICE_INFLIGHT = asyncio.get_event_loop().create_future()
+    try:
+        outcome = await _fetch_prices_upstream()
+    except Exception as exc:
+        _PRICE_INFLIGHT.set_exception(exc)
+        _PRICE_INFLIGHT.exception()  # mark retrieved even with no waiters
+        _PRICE_INFLIGHT = None
+        raise
+    else:
+        _PRICE_INFLIGHT.set_result(outcome)
+        _PRICE_INFLIGHT = None
+        return outcome
 
 
-async def fetch_prices() -> Tuple[str, Dict[str, Tuple[str, datetime]]]:
-    """Fetch and parse the latest market prices from tgju.org."""
+async def _fetch_prices_upstream() -> Tuple[str, Dict[str, Tuple[str, datetime]], bool]:
+    """Perform the real tgju fetch; only ever called by ``fetch_prices``."""
 
+    global _PRICE_CACHE
     try:
         data = await fetch_json(TGJU_API_URL)
         current = data.get("current", {})
+        # فقط سه کلید مورد نیاز را نگه می‌داریم تا دیکشنری چندصدتایی tgju
+        # بلافاصله آزاد شود
+        wanted = {k: current[k] for k, _, _ in PRICE_KEYS.values() if k in current}
+        del data, current
         result: Dict[str, Tuple[str, datetime]] = {}
 
-        for label, key in PRICE_KEYS.items():
-            entry = current.get(key)
+        for label, (key, to_toman, fmt) in PRICE_KEYS.items():
+            entry = wanted.get(key)
             if not entry or "p" not in entry or "ts" not in entry:
                 raise ValueError(f"Missing or malformed data for '{key}'")
 
             price_str: str = entry.get("p", "0")
             ts_str: str = entry.get("ts")
 
-            # پاک کردن کاما و تبدیل به عدد
-            price_clean = price_str.replace(",", "")
+            # پاک کردن کاما و تبدیل به عدد؛ دلار و سکه همیشه مقدار صحیح
+            # ریالی دارند، پس مستقیم int و تبدیل به تومان
+            price_clean = price_str.translate(_NOCOMMA)
             try:
-                value_num = float(price_clean)
+                value_num = int(price_clean) // 10 if to_toman else float(price_clean)
             except ValueError:
                 value_num = 0.0
 
-            # برای دلار و سکه تبدیل به تومان
-            if key != "ons":
-                value_num /= 10
-
             # فرمت نمایش
-            if key == "ons":
-                formatted_value = f"{value_num:,.2f}"
-            else:
-                formatted_value = f"{int(value_num):,}"
+            formatted_value = fmt(value_num)
 
-            try:
-                timestamp = datetime.fromisoformat(ts_str)
-            except Exception:
-                timestamp = datetime.now(timezone.utc)
+            timestamp = _parse_tgju_ts(ts_str)
 
             result[label] = (formatted_value, timestamp)
 
         server_time = datetime.now(timezone.utc).isoformat()
-        return server_time, result
+        now = time.monotonic()
+        _PRICE_CACHE = (now, now + STALE_CACHE_TTL, (server_time, result))
+        return server_time, result, False
 
     except Exception as e:
+        # در صورت خطای مقطعی سرور، آخرین داده‌ی موفق را نمایش بده
+        if _PRICE_CACHE and time.monotonic() < _PRICE_CACHE[1]:
+            logging.warning("fetch_prices failed, serving stale data: %s", e)
+            server_time, result = _PRICE_CACHE[2]
+            return server_time, result, True
         logging.exception("❌ خطا در تابع fetch_prices(): %s", str(e))
         raise  # تا در هندلر بالا پیام خطا به کاربر نمایش داده شود
 
 
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
-async def fetch_news() -> List[Tuple[str, str]]:
-    headlines: List[Tuple[str, str]] = []
-    economy_keywords = [
-        "اقتصاد",
-        "اقتصادی",
-        "بانک",
-        "ارز",
-        "پول",
-        "بورس",
-        "سکه",
-        "دلار",
-    ]
-
-    for source, url in NEWS_FEEDS.items():
-        try:
-            async with httpx.AsyncClient(headers={"User-Agent": "Mozilla/5.0"}) as client:
-                response = await client.get(url)
-                response.encoding = 'utf-8'  # ⬅️ این خط کلیدی است
-                response.raise_for_status()
+ECONOMY_KEYWORDS: List[str] = [
+    "اقتصاد",
+    "اقتصادی",
+    "بانک",
+    "ارز",
+    "پول",
+    "بورس",
+    "سکه",
+    "دلار",
+]
 
-            # استفاده از محتوای متنی به جای باینری
-            soup = BeautifulSoup(response.text, "xml")
+# One compiled alternation instead of eight substring scans per headline.
+_ECONOMY_RE = re.compile("|".join(re.escape(k) for k in ECONOMY_KEYWORDS))
 
-            items = soup.find_all("item")[:HEADLINES_PER_SOURCE]
-            for item in items:
-                title = item.title.text.strip()
-                link = item.link.text.strip()
+# Conditional-GET state per feed URL: the validators from the last
+# successful fetch plus the headlines parsed from it.  When a feed has not
+# changed the server answers 304 with an empty body and the stored
+# headlines are reused — this matters most for IRNA, whose general feed is
+# by far the largest of the three.
+_FEED_STATE: Dict[str, Tuple[Optional[str], Optional[str], List[Tuple[str, str]]]] = {}
 
-                # فیلتر اقتصادی فقط برای IRNA
-                if source == "IRNA":
-                    if not any(k in title for k in economy_keywords):
-                        continue
 
-                headlines.append((title, link))
+async def _fetch_one(source: str, url: str) -> List[Tuple[str, str]]:
+    """Fetch and parse the headlines from a single RSS feed.
 
-        except Exception as exc:
-            logging.error("Error fetching news from %s: %s", source, exc)
+    The feed is parsed incrementally while it downloads: chunks are fed to
+    an ``XMLPullParser`` and the connection is dropped as soon as
+    ``HEADLINES_PER_SOURCE`` ``<item>`` elements have been seen, so a
+    multi-hundred-KB feed costs only its first few KB of transfer and a
+    handful of element objects regardless of its total size.  A conditional
+    GET is sent when validators from a previous fetch are on hand, so an
+    unchanged feed costs a 304 with no body at all.
+    """
 
-    return headlines[: HEADLINES_PER_SOURCE * len(NEWS_FEEDS)]
+    etag, last_modified, cached = _FEED_STATE.get(url, (None, None, []))
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    # lxml روی بایت‌های خام کار می‌کند و encoding را از اعلان XML می‌خواند،
+    # بنابراین نیازی به response.encoding = 'utf-8' نیست.
+    parser = etree.XMLPullParser(events=("end",))
+    items: List[Tuple[str, str]] = []
+
+    async with _get_http_client().stream("GET", url, headers=headers) as response:
+        if response.status_code == 304:
+            # فید تغییری نکرده؛ همان تیترهای قبلی معتبرند
+            return cached
+        response.raise_for_status()
+        resp_etag = response.headers.get("etag")
+        resp_last_modified = response.headers.get("last-modified")
+        async for chunk in response.aiter_bytes():
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if elem.tag != "item":
+                    continue
+                title = (elem.findtext("title") or "").strip()
+                link = (elem.findtext("link") or "").strip()
+                items.append((title, link))
+                elem.clear()
+                if len(items) >= HEADLINES_PER_SOURCE:
+                    break
+            if len(items) >= HEADLINES_PER_SOURCE:
+                break
+
+    headlines: List[Tuple[str, str]] = []
+    for title, link in items:
+        # فیلتر اقتصادی فقط برای IRNA
+        if source == "IRNA" and not _ECONOMY_RE.search(title):
+            continue
+        headlines.append((title, link))
+
+    if resp_etag or resp_last_modified:
+        _FEED_STATE[url] = (resp_etag, resp_last_modified, headlines)
+    return headlines
+
+
+async def fetch_news() -> Tuple[List[Tuple[str, str]], bool]:
+    global _NEWS_CACHE
+    if news_cache_is_warm():
+        return _NEWS_CACHE[2], False
+
+    # دریافت همه فیدها به صورت همزمان؛ زمان کل برابر کندترین فید می‌شود
+    # نه مجموع زمان همه فیدها.
+    results = await asyncio.gather(
+        *(_fetch_one(source, url) for source, url in NEWS_FEEDS.items()),
+        return_exceptions=True,
+    )
+
+    headlines: List[Tuple[str, str]] = []
+    for source, result in zip(NEWS_FEEDS, results):
+        if isinstance(result, Exception):
+            logging.error("Error fetching news from %s: %s", source, result)
+            continue
+        headlines.extend(result)
+
+    if not headlines:
+        # همه فیدها خطا دادند؛ اگر داده‌ی قبلی هنوز قابل استفاده است همان را بده
+        if _NEWS_CACHE and time.monotonic() < _NEWS_CACHE[1]:
+            logging.warning("fetch_news failed, serving stale data")
+            return _NEWS_CACHE[2], True
+        return [], False
+
+    headlines = headlines[: HEADLINES_PER_SOURCE * len(NEWS_FEEDS)]
+    now = time.monotonic()
+    _NEWS_CACHE = (now, now + STALE_CACHE_TTL, headlines)
+    return headlines, False
 
 
 
@@ -267,7 +529,11 @@ def format_time_difference(past: datetime) -> str:
 # -----------------------------------------------------------------------------
 # Bot setup and handlers
 #
-logging.basicConfig(level=logging.INFO)
+# Default to WARNING in production: per-update INFO logging (and the old
+# LoggingMiddleware) formats a line for every inbound update and every
+# outbound HTTP request, which is pure overhead on the event loop under
+# load.  Set LOG_LEVEL=INFO or DEBUG when diagnosing issues.
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING"))
 logger = logging.getLogger(__name__)
 
 if not BOT_TOKEN:
@@ -278,7 +544,28 @@ if not BOT_TOKEN:
 
 bot = Bot(token=BOT_TOKEN)
 dp = Dispatcher(bot)
-dp.middleware.setup(LoggingMiddleware())
+
+
+@dp.chat_member_handler()
+async def channel_member_updated(update: types.ChatMemberUpdated) -> None:
+    """Track channel joins/leaves so membership checks stay local.
+
+    Telegram pushes a ``chat_member`` update whenever someone's status in
+    the channel changes; mirroring it into ``_KNOWN_MEMBERS`` means
+    ``is_user_member`` usually answers from a set lookup instead of a
+    ``get_chat_member`` round trip.
+    """
+    # Reject updates from any chat other than the channel; username-less
+    # chats (e.g. private groups the bot administers) must not slip through.
+    if not update.chat.username or f"@{update.chat.username}".lower() != CHANNEL_ID:
+        return
+    user_id = update.new_chat_member.user.id
+    if update.new_chat_member.status in _MEMBER_STATUSES:
+        _KNOWN_MEMBERS.add(user_id)
+    else:
+        _KNOWN_MEMBERS.discard(user_id)
+        # Drop any positive TTL entry so the leave takes effect immediately
+        _MEMBER_CACHE.pop(user_id, None)
 
 
 @dp.message_handler(commands=["start", "price", "news"])
@@ -289,7 +576,7 @@ async def restricted_handler(message: types.Message):
     # بررسی عضویت
     is_sub = await is_user_member(user_id, bot, channel_username)
     if not is_sub:
-        await message.answer(
+        await _answer(message,
             "❗ برای استفاده از این ربات، ابتدا باید عضو کانال ما شوید:\n"
             "👉 [عضویت در کانال](https://t.me/sarasoo)",
             parse_mode="Markdown"
@@ -308,7 +595,7 @@ async def restricted_handler(message: types.Message):
             "می‌توانید به‌جای استفاده از دستورات، کلمات کلیدی مانند «دلار»، «سکه» یا "
             "«اخبار اقتصادی» را نیز ارسال کنید."
         )
-        await message.answer(text)
+        await _answer(message, text)
     elif message.text == "/price":
         await cmd_price(message)
     elif message.text == "/news":
@@ -332,7 +619,7 @@ async def cmd_help(message: types.Message) -> None:
         "همچنین می‌توانید کلمات «دلار»، «سکه»، «طلا» یا «اخبار اقتصادی» را بدون"
         " دستور تایپ کنید تا ربات پاسخ مناسب بدهد."
     )
-    await message.answer(help_text)
+    await _answer(message, help_text)
 
 
 @dp.message_handler(commands=["price"])
@@ -342,33 +629,43 @@ async def cmd_price(message: types.Message) -> None:
     Fetches the latest prices from TGJU and sends a formatted message to
     the user.  A loading indicator is displayed while fetching data.
     """
-    # Send a temporary loading message
-    loading_msg = await message.answer("⏳ در حال دریافت اطلاعات...")
+    # Send a temporary loading message, but only when an upstream fetch is
+    # actually pending: a warm cache answers in microseconds and the loading
+    # indicator would just burn two Telegram API calls per command.
+    loading_msg = None
+    if not price_cache_is_warm():
+        loading_msg = await _answer(message, "⏳ در حال دریافت اطلاعات...")
     try:
-        server_time, prices = await fetch_prices()
+        server_time, prices, stale = await fetch_prices()
         # Build the response text
         lines: List[str] = []
+        # Track the most recent update time while building the lines so the
+        # dict is only walked once
+        last_update = datetime.min.replace(tzinfo=timezone.utc)
         for label, (value, timestamp) in prices.items():
             if label == "انس طلا جهانی":
                 lines.append(f"📉 {label}: {value} دلار")
             else:
                 lines.append(f"💵 {label}: {value} تومان")
-        # Determine the most recent update time among the instruments
-        last_update = max(ts for _, (_, ts) in prices.items())
+            if timestamp > last_update:
+                last_update = timestamp
         time_diff_str = format_time_difference(last_update)
         lines.append(f"(به‌روزرسانی: {time_diff_str})")
+        if stale:
+            lines.append(STALE_NOTICE)
         # Join lines with two spaces at end of each line to preserve RTL ordering
         response_text = "  \n".join(lines)
-        await message.answer(response_text)
+        await _answer(message, response_text)
     except Exception as exc:
         logger.exception("Error in /price command")
-        await message.answer("❌ خطا در دریافت داده‌ها. لطفاً بعداً تلاش کنید.")
+        await _answer(message, "❌ خطا در دریافت داده‌ها. لطفاً بعداً تلاش کنید.")
     finally:
         # Delete the loading message to keep the chat clean
-        try:
-            await loading_msg.delete()
-        except Exception:
-            pass
+        if loading_msg is not None:
+            try:
+                await _delete(loading_msg)
+            except Exception:
+                pass
 
 
 @dp.message_handler(commands=["news"])
@@ -379,26 +676,31 @@ async def cmd_news(message: types.Message) -> None:
     numbered list to the user.  A loading message is shown while data
     fetching is in progress.
     """
-    loading_msg = await message.answer("⏳ در حال دریافت تیترهای خبری...")
+    loading_msg = None
+    if not news_cache_is_warm():
+        loading_msg = await _answer(message, "⏳ در حال دریافت تیترهای خبری...")
     try:
-        items = await fetch_news()
+        items, stale = await fetch_news()
         if not items:
-            await message.answer("هیچ تیتر اقتصادی پیدا نشد. لطفاً بعداً تلاش کنید.")
+            await _answer(message, "هیچ تیتر اقتصادی پیدا نشد. لطفاً بعداً تلاش کنید.")
         else:
             lines = ["📰 تیترهای اقتصادی جدید:"]
             for idx, (title, link) in enumerate(items, start=1):
                 lines.append(f"{idx}. [{title}]({link})")
+            if stale:
+                lines.append(STALE_NOTICE)
             # Join using newline; no extra spaces needed here
             response_text = "\n".join(lines)
-            await message.answer(response_text, parse_mode="Markdown")
+            await _answer(message, response_text, parse_mode="Markdown")
     except Exception:
         logger.exception("Error in /news command")
-        await message.answer("❌ خطا در دریافت اخبار. لطفاً بعداً تلاش کنید.")
+        await _answer(message, "❌ خطا در دریافت اخبار. لطفاً بعداً تلاش کنید.")
     finally:
-        try:
-            await loading_msg.delete()
-        except Exception:
-            pass
+        if loading_msg is not None:
+            try:
+                await _delete(loading_msg)
+            except Exception:
+                pass
 
 
 
@@ -413,32 +715,57 @@ async def keyword_handler(message: types.Message) -> None:
     text = message.text or ""
     lowered = text.strip().lower()
     # Check for news keywords first
-    if "اخبار" in lowered or "اخبار اقتصادی" in lowered:
+    if _NEWS_RE.search(lowered):
         # Defer to news handler
         await cmd_news(message)
         return
     # Check for price keywords
-    if any(keyword in lowered for keyword in KEYWORD_TRIGGER_LIST):
+    if _KEYWORD_RE.search(lowered):
         await cmd_price(message)
         return
     # Default reply for unknown messages
-    await message.answer(
+    await _answer(message,
         "متوجه نشدم. برای مشاهده راهنما دستور /help را ارسال کنید."
     )
 
 
 async def on_startup(_):
-    """Runs on bot startup to log a message."""
+    """Runs on bot startup to create the shared HTTP client."""
+    _get_http_client()
     logger.info("Bot started successfully.")
 
 
+async def on_shutdown(_):
+    """Runs on bot shutdown to close the shared HTTP client."""
+    global HTTP_CLIENT
+    if HTTP_CLIENT is not None:
+        await HTTP_CLIENT.aclose()
+        HTTP_CLIENT = None
+    logger.info("Bot stopped.")
+
+
 def main() -> None:
     """Entrypoint for running the bot.
 
     This function simply starts polling and blocks until interrupted.  It
     exists so the module can be imported without side effects.
     """
-    executor.start_polling(dp, skip_updates=True, on_startup=on_startup)
+    # uvloop's libuv-based event loop is noticeably faster than the stdlib
+    # selector for the pure-I/O work this bot does (polling, httpx requests,
+    # RSS streaming).  It is Linux-only, so fall back silently elsewhere.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    # chat_member updates are not delivered unless explicitly requested
+    executor.start_polling(
+        dp,
+        skip_updates=True,
+        on_startup=on_startup,
+        on_shutdown=on_shutdown,
+        allowed_updates=["message", "chat_member"],
+    )
 
 
 if __name__ == "__main__":